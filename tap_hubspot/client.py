@@ -1,16 +1,26 @@
 """REST client handling, including HubSpotStream base class."""
 
-import gzip
-import json
+import contextlib
+import copy
+import hashlib
+import io
 import logging
-from datetime import datetime
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import IO, Any, Dict, Iterable, Optional
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Type, Union
 from uuid import uuid4
 
+import orjson
 import requests
-from dateutil.parser import parse as parse_datetime
+import singer_sdk._singerlib as singer
+from dateutil.parser import parse as dateutil_parse
 from requests import Response
+from requests.adapters import HTTPAdapter
+from singer_sdk import typing as th  # JSON Schema typing helpers
 from singer_sdk.authenticators import BearerTokenAuthenticator
 from singer_sdk.helpers._batch import BaseBatchFileEncoding, BatchConfig
 from singer_sdk.helpers.jsonpath import extract_jsonpath
@@ -18,8 +28,75 @@ from singer_sdk.pagination import BaseAPIPaginator
 from singer_sdk.streams import RESTStream
 from singer_sdk.streams.core import REPLICATION_INCREMENTAL
 
+try:
+    # Same file format as gzip but with SIMD accelerated compression
+    from isal import igzip as gzip
+except ImportError:
+    import gzip  # type: ignore
+
+try:
+    # C parser, much faster than the standard library
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+
+    def _parse_iso_datetime(datetime_string: str) -> datetime:
+        # Python < 3.11 does not understand the Z suffix
+        return datetime.fromisoformat(datetime_string.replace("Z", "+00:00"))
+
+
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
+# Where all HubSpot endpoints put their records and next page token
+RESULTS_JSONPATH = "$.results[*]"
+NEXT_PAGE_TOKEN_JSONPATH = "$.paging.next.after"
+
+# Lets many small records coalesce into a single deflate call
+BATCH_WRITE_BUFFER_SIZE = 1 << 20
+# Records serialized together before being handed to the compressor thread
+BATCH_WRITE_CHUNK_RECORDS = 1000
+# Chunks of serialized records waiting for the compressor thread
+BATCH_WRITE_QUEUE_SIZE = 8
+
+
+# Guards the tap state snapshot shared by streams syncing concurrently
+STATE_LOCK = threading.RLock()
+
+
+def _assume_utf8(response: Response, *args: Any, **kwargs: Any) -> None:
+    # HubSpot always responds in UTF-8, so skip charset detection in response.text
+    if response.encoding is None:
+        response.encoding = "utf-8"
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.hooks["response"].append(_assume_utf8)
+    # Enough connections for all streams syncing concurrently
+    session.mount("https://", HTTPAdapter(pool_maxsize=32))
+    return session
+
+
+# Shared by all streams so connections, and their TLS handshakes, are reused
+_SESSION = _build_session()
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp like HubSpot's 2022-04-13T07:41:30.007Z"""
+    try:
+        return _parse_iso_datetime(value)
+    except ValueError:
+        # Less common formats, e.g. user supplied in the config
+        return dateutil_parse(value)
+
+
+def _parse_response_json(response: Response) -> Any:
+    """Parse the response body once and share it between stream and paginator."""
+    data = getattr(response, "_hubspot_json", None)
+    if data is None:
+        data = orjson.loads(response.content)
+        setattr(response, "_hubspot_json", data)
+    return data
+
 
 class HubSpotStream(RESTStream):
     """HubSpot stream class."""
@@ -29,9 +106,9 @@ class HubSpotStream(RESTStream):
     url_base = "https://api.hubapi.com"
 
     # Or override `parse_response`.
-    records_jsonpath = "$.results[*]"
+    records_jsonpath = RESULTS_JSONPATH
     # Or override `get_next_page_token`.
-    next_page_token_jsonpath = "$.paging.next.after"
+    next_page_token_jsonpath = NEXT_PAGE_TOKEN_JSONPATH
 
     # Override in subclass to fetch additional properties
     properties_object_type: Optional[str] = None
@@ -43,7 +120,19 @@ class HubSpotStream(RESTStream):
 
     # Internally used to workaround HubSpot's 10K query limit
     _appropriate_replication_key_value: Optional[datetime] = None
+    # Same value in milliseconds, as sent to HubSpot
+    _replication_key_value_ms: Optional[int] = None
+    # Where to continue the query when the 10K limit is hit
+    _last_replication_key_value: Optional[datetime] = None
     _force_batch = False
+    # Search request body reused between pages
+    _payload_template: Optional[dict] = None
+    # Tap state written in STATE messages while streams sync concurrently
+    _state_snapshot: Optional[dict] = None
+    # post_process specialized for the config, see _build_post_process
+    _post_process_impl: Optional[
+        Callable[[dict, Optional[dict]], Optional[dict]]
+    ] = None
 
     @property
     def batch_size(self) -> int:  # type: ignore
@@ -80,6 +169,18 @@ class HubSpotStream(RESTStream):
         token: str = self.config["hapikey"]
         return BearerTokenAuthenticator.create_for_stream(self, token)
 
+    @property
+    def requests_session(self) -> requests.Session:
+        return _SESSION
+
+    @property
+    def nested_json_type(self) -> Union[th.JSONTypeHelper, Type[th.JSONTypeHelper]]:
+        """Schema type of properties and associations"""
+        if self.config.get("nested_as_objects", False):
+            return th.ObjectType()
+        else:
+            return th.StringType
+
     @property
     def http_headers(self) -> dict:
         """Return the http headers needed."""
@@ -90,6 +191,30 @@ class HubSpotStream(RESTStream):
         # headers["Private-Token"] = self.config.get("auth_token")
         return headers
 
+    def _write_state_message(self) -> None:
+        if self._state_snapshot is None:
+            super()._write_state_message()
+            return
+
+        # Only this stream's thread changes its bookmark, but the other streams'
+        # bookmarks may be changing, so emit them as of their last STATE message
+        with STATE_LOCK:
+            bookmarks = self._state_snapshot["bookmarks"]
+            bookmarks[self.name] = copy.deepcopy(self.stream_state)
+            singer.write_message(singer.StateMessage(value=self._state_snapshot))
+
+    def _request(
+        self, prepared_request: requests.PreparedRequest, context: Optional[dict]
+    ) -> requests.Response:
+        self._wait_for_rate_limit()
+        return super()._request(prepared_request, context)
+
+    def _wait_for_rate_limit(self) -> None:
+        """Shares `max_requests_per_second` between all concurrently syncing streams"""
+        max_requests_per_second = self.config.get("max_requests_per_second")
+        if max_requests_per_second:
+            _RATE_LIMITER.wait(1 / max_requests_per_second)
+
     def get_new_paginator(self) -> BaseAPIPaginator:
         """Get a fresh paginator for this API endpoint.
 
@@ -147,46 +272,63 @@ class HubSpotStream(RESTStream):
         if self.forced_get or self.replication_method != REPLICATION_INCREMENTAL:
             return None
 
-        body: dict = {
-            "sorts": [
-                {
-                    # This is inside the properties object
-                    "propertyName": self.replication_key,
-                    "direction": "ASCENDING",
-                }
-            ],
-            # Hubspot sets a limit of most 100 per request. Default is 10
-            "limit": 100,
-        }
-
-        props_to_get = self.get_properties()
-        if props_to_get:
-            body["properties"] = props_to_get
+        # requests serializes the body as soon as the request is prepared, so the
+        # same dict can be reused for every page
+        body = self._payload_template
+        if body is None:
+            body = {
+                "sorts": [
+                    {
+                        # This is inside the properties object
+                        "propertyName": self.replication_key,
+                        "direction": "ASCENDING",
+                    }
+                ],
+                # Hubspot sets a limit of most 100 per request. Default is 10
+                "limit": 100,
+            }
+
+            props_to_get = self.get_properties()
+            if props_to_get:
+                body["properties"] = props_to_get
+
+            self._payload_template = body
 
         if next_page_token:
             body["after"] = next_page_token
-
-        replication_key_value = self.get_appropriate_replication_key_value(context)
+        else:
+            body.pop("after", None)
+
+        if self._replication_key_value_ms is None:
+            replication_key_value = self.get_appropriate_replication_key_value(context)
+            if replication_key_value:
+                # It's never specified anywhere, but Hubspot API accepts
+                # timestamps in milliseconds
+                self._replication_key_value_ms = int(
+                    replication_key_value.timestamp() * 1000
+                )
         self.logger.debug(
-            f"PrepareRequest rep key val: {replication_key_value}, "
+            f"PrepareRequest rep key val: {self._replication_key_value_ms}, "
             f"after: {next_page_token}"
         )
 
-        if replication_key_value:
+        if self._replication_key_value_ms is not None:
             # Only filter in case we have a value to filter on
-            body["filterGroups"] = [
-                {
-                    "filters": [
-                        {
-                            "propertyName": self.replication_key,
-                            "operator": "GTE",
-                            # It's never specified anywhere, but Hubspot API accepts
-                            # timestamps in milliseconds
-                            "value": int(replication_key_value.timestamp() * 1000),
-                        }
-                    ]
-                }
-            ]
+            if "filterGroups" not in body:
+                body["filterGroups"] = [
+                    {
+                        "filters": [
+                            {
+                                "propertyName": self.replication_key,
+                                "operator": "GTE",
+                            }
+                        ]
+                    }
+                ]
+            gte_filter = body["filterGroups"][0]["filters"][0]
+            gte_filter["value"] = self._replication_key_value_ms
+        else:
+            body.pop("filterGroups", None)
 
         return body
 
@@ -223,7 +365,7 @@ class HubSpotStream(RESTStream):
 
         if replication_key_value is None:
             # Fallback to EPOCH
-            replication_key_value = parse_datetime("1970-01-1T00:00:00.000000Z")
+            replication_key_value = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
         self._appropriate_replication_key_value = replication_key_value
         return self._appropriate_replication_key_value
@@ -232,7 +374,19 @@ class HubSpotStream(RESTStream):
         """
         Should only be called by the pager when the 10K query limit is reached
         """
-        self._appropriate_replication_key_value = None
+        # Records are sorted on the replication key, so continue the query from
+        # the last record seen. With GTE since other records can share its value.
+        last_value = self._last_replication_key_value
+        if (
+            last_value is not None
+            and last_value == self._appropriate_replication_key_value
+        ):
+            raise RuntimeError(
+                f"More than 10K records have {self.replication_key} {last_value}, "
+                "can't page past them."
+            )
+        self._appropriate_replication_key_value = last_value
+        self._replication_key_value_ms = None
         self._force_batch = True
 
     def get_properties(self) -> Iterable[str]:
@@ -244,6 +398,36 @@ class HubSpotStream(RESTStream):
             self.extra_properties = []
             return self.extra_properties
 
+        properties = self._fetch_properties()
+
+        include_properties = self.config.get("include_properties", {}).get(self.name)
+        if include_properties is not None:
+            known = set(properties)
+            unknown = [p for p in include_properties if p not in known]
+            if unknown:
+                self.logger.warning(
+                    f"Ignoring unknown {self.name} properties: {', '.join(unknown)}"
+                )
+            if len(unknown) == len(include_properties):
+                # An empty list would make HubSpot send its default properties
+                raise RuntimeError(
+                    f"No {self.name} properties to include that exist in HubSpot"
+                )
+            # Records can't be synced incrementally without the replication key
+            wanted = set(include_properties)
+            if self.replication_key:
+                wanted.add(self.replication_key)
+            properties = [p for p in properties if p in wanted]
+
+        self.extra_properties = properties
+        return self.extra_properties
+
+    def _fetch_properties(self) -> list[str]:
+        """Returns all properties HubSpot has for the object type"""
+        cached_properties = self._read_properties_cache()
+        if cached_properties is not None:
+            return cached_properties
+
         request = self.build_prepared_request(
             method="GET",
             url="".join(
@@ -252,35 +436,114 @@ class HubSpotStream(RESTStream):
             headers=self.http_headers,
         )
 
-        session = self._requests_session or requests.Session()
-
-        r = session.send(request)
+        self._wait_for_rate_limit()
+        r = self.requests_session.send(request)
 
         if r.status_code != 200:
             raise RuntimeError(f"Could not fetch properties: {r.status_code}, {r.text}")
 
-        self.extra_properties = []
-        for p in extract_jsonpath("$.results[*]", input=r.json()):
-            self.extra_properties.append(p["name"])
-        return self.extra_properties
+        properties = [p["name"] for p in orjson.loads(r.content).get("results", [])]
+        self._write_properties_cache(properties)
+        return properties
+
+    @property
+    def _properties_cache_path(self) -> Path:
+        # Different HubSpot accounts have different properties
+        token_hash = hashlib.sha256(self.config["hapikey"].encode()).hexdigest()
+        return (
+            SCHEMAS_DIR
+            / ".properties_cache"
+            / f"{self.properties_object_type}-{token_hash[:16]}.json"
+        )
+
+    def _read_properties_cache(self) -> Optional[list[str]]:
+        """Returns cached properties if enabled and not older than the TTL"""
+        if not self.config.get("properties_cache", False):
+            return None
+
+        path = self._properties_cache_path
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.config.get("properties_ttl", 3600):
+                return None
+            return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _write_properties_cache(self, properties: list[str]) -> None:
+        if not self.config.get("properties_cache", False):
+            return
+
+        path = self._properties_cache_path
+        tmp_path = path.with_name(f"{path.name}.{uuid4()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(properties))
+            # Atomic, so concurrent runs never read a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not cache properties in {path}: {e}")
 
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """Parse the response and return an iterator of result rows."""
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+        # Not streamed: the paginator needs paging.next.after from the same body
+        # once the records are done, and HubSpot pages are only 100 records
+        data = _parse_response_json(response)
+        if self.records_jsonpath == RESULTS_JSONPATH:
+            # A plain lookup avoids walking the whole page with jsonpath
+            yield from data.get("results", [])
+        else:
+            yield from extract_jsonpath(self.records_jsonpath, input=data)
 
     def post_process(self, row: dict, context: Optional[dict] = None) -> Optional[dict]:
         """As needed, append or transform raw data to match expected structure."""
-        # Need to copy the replication key to top level so that meltano can read it
-        if self.replication_key:
-            row[self.replication_key] = self.get_replication_key_value(row)
-        # Convert properties and associations back into JSON
-        if "properties" in row:
-            jsonprops = json.dumps(row.get("properties"))
-            row["properties"] = jsonprops
-        if "associations" in row:
-            jsonassoc = json.dumps(row.get("associations"))
-            row["associations"] = jsonassoc
-        return row
+        post_process = self._post_process_impl
+        if post_process is None:
+            # Config can't change during a sync, so specialize once
+            post_process = self._post_process_impl = self._build_post_process()
+            if type(self).post_process is HubSpotStream.post_process:
+                # Nothing overrides this, so skip it for the following records
+                self.post_process = post_process  # type: ignore
+        return post_process(row, context)
+
+    def _build_post_process(
+        self,
+    ) -> Callable[[dict, Optional[dict]], Optional[dict]]:
+        """Builds a post_process without per record config and attribute lookups"""
+        replication_key = self.replication_key
+        stringify_nested = not self.config.get("nested_as_objects", False)
+        dumps = orjson.dumps
+
+        get_replication_key_value = self.get_replication_key_value
+        if (
+            type(self).get_replication_key_value
+            is HubSpotStream.get_replication_key_value
+        ):
+
+            def get_replication_key_value(row: dict) -> Optional[datetime]:
+                properties = row.get("properties")
+                if properties is None:
+                    return None
+                # String like 2022-04-13T07:41:30.007Z
+                return parse_datetime(properties[replication_key])
+
+        def post_process(row: dict, context: Optional[dict] = None) -> Optional[dict]:
+            # Need to copy the replication key to top level so meltano can read it
+            if replication_key:
+                value = get_replication_key_value(row)
+                row[replication_key] = value
+                self._last_replication_key_value = value
+            if stringify_nested:
+                # Convert properties and associations back into JSON
+                properties = row.get("properties")
+                if properties is not None:
+                    row["properties"] = dumps(properties).decode()
+                associations = row.get("associations")
+                if associations is not None:
+                    row["associations"] = dumps(associations).decode()
+            return row
+
+        return post_process
 
     def get_replication_key_value(self, row: dict) -> Optional[datetime]:
         """Reads the replication value from a record. Default implementation assumes
@@ -315,14 +578,49 @@ class HubSpotStream(RESTStream):
         chunk_size = 0
         filename: Optional[str] = None
         f: Optional[IO] = None
-        gz: Optional[gzip.GzipFile] = None
+        out: Optional[_BackgroundGzipWriter] = None
+
+        # Looked up once, this loop runs for every record
+        batch_size = self.batch_size
+        dumps = orjson.dumps
+        dumps_option = orjson.OPT_APPEND_NEWLINE
 
         with batch_config.storage.fs() as fs:
-            for record in self._sync_records(context, write_messages=False):
-                if self._force_batch or chunk_size >= self.batch_size:
-                    if gz:
-                        gz.close()
-                    gz = None
+            try:
+                for record in self._sync_records(context, write_messages=False):
+                    if self._force_batch or chunk_size >= batch_size:
+                        if out:
+                            out.close()
+                        out = None
+                        if f:
+                            f.close()
+                        f = None
+                        if filename:
+                            file_url = fs.geturl(filename)
+                            yield batch_config.encoding, [file_url]
+                        else:
+                            raise ValueError("Filename is not set!")
+
+                        filename = None
+
+                        i += 1
+                        chunk_size = 0
+                        self._force_batch = False
+
+                    if filename is None:
+                        filename = f"{prefix}{sync_id}-{i}.json.gz"
+                        f = fs.open(filename, "wb")
+                        out = _BackgroundGzipWriter(f)
+
+                    if not out:
+                        raise ValueError("out not initialized!")
+                    out.write(dumps(record, default=str, option=dumps_option))
+                    chunk_size += 1
+
+                if chunk_size > 0:
+                    if out:
+                        out.close()
+                    out = None
                     if f:
                         f.close()
                     f = None
@@ -331,33 +629,14 @@ class HubSpotStream(RESTStream):
                         yield batch_config.encoding, [file_url]
                     else:
                         raise ValueError("Filename is not set!")
-
-                    filename = None
-
-                    i += 1
-                    chunk_size = 0
-                    self._force_batch = False
-
-                if filename is None:
-                    filename = f"{prefix}{sync_id}-{i}.json.gz"
-                    f = fs.open(filename, "wb")
-                    gz = gzip.GzipFile(fileobj=f, mode="wb")
-
-                if not gz:
-                    raise ValueError("gz not initialized!")
-                gz.write((json.dumps(record, default=str) + "\n").encode())
-                chunk_size += 1
-
-            if chunk_size > 0:
-                if gz:
-                    gz.close()
+            finally:
+                # Only set if the sync failed or this generator was abandoned,
+                # in which case the compressor thread still has to be stopped
+                if out:
+                    with contextlib.suppress(Exception):
+                        out.close()
                 if f:
                     f.close()
-                if filename:
-                    file_url = fs.geturl(filename)
-                    yield batch_config.encoding, [file_url]
-                else:
-                    raise ValueError("Filename is not set!")
 
 
 class HubspotJSONPathPaginator(BaseAPIPaginator[Optional[str]]):
@@ -428,32 +707,133 @@ class HubspotJSONPathPaginator(BaseAPIPaginator[Optional[str]]):
             self._really_finished = True
             return None
 
-        all_matches = extract_jsonpath(self._jsonpath, response.json())
-        next_page_token = next(iter(all_matches), None)
+        if self._jsonpath == NEXT_PAGE_TOKEN_JSONPATH:
+            # A plain lookup avoids walking the whole page with jsonpath
+            paging = _parse_response_json(response).get("paging", {})
+            next_page_token = paging.get("next", {}).get("after")
+        else:
+            all_matches = extract_jsonpath(
+                self._jsonpath, _parse_response_json(response)
+            )
+            next_page_token = next(iter(all_matches), None)
 
         if next_page_token is None:
             self._really_finished = True
 
-        try:
-            # Here's a quirk: If more than 10 000 results are in the query,
-            # then HubSpot will return error 400 when you exceed 10 000.
-            # Tell the stream to change the sorting key
-            if (
-                not self.forced_get
-                and self.replication_method == REPLICATION_INCREMENTAL
-                and next_page_token is not None
-                and int(next_page_token) + 100 >= 10000
-            ):
+        if (
+            not self.forced_get
+            and self.replication_method == REPLICATION_INCREMENTAL
+            and next_page_token is not None
+        ):
+            if not str(next_page_token).isdigit():
+                # Not an int, so can't do anything
+                self._really_finished = True
+            elif int(next_page_token) + 100 >= 10000:
+                # Here's a quirk: If more than 10 000 results are in the query,
+                # then HubSpot will return error 400 when you exceed 10 000.
+                # Tell the stream to change the sorting key
                 self.stream.logger.debug(
                     f"Paginator: Hit 10K Limit for {next_page_token}"
                 )
                 next_page_token = None
                 self.stream._pager_reset_replication_key_value()
                 self._really_finished = False
-        except Exception:
-            # Not an int, so can't do anything
-            self._really_finished = True
-            pass
 
         self.stream.logger.debug(f"Paginator: {next_page_token}")
         return next_page_token
+
+
+class _BackgroundGzipWriter:
+    """Compresses and writes batch data on a separate thread.
+
+    Serialized records are handed over through a bounded queue so that deflate
+    and the (possibly remote) file writes overlap with fetching records.
+    """
+
+    def __init__(self, fileobj: IO) -> None:
+        # Fastest level, JSON still compresses well
+        gz = gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=1)
+        # GzipFile works fine as the raw stream of a BufferedWriter
+        self._out = io.BufferedWriter(
+            gz, buffer_size=BATCH_WRITE_BUFFER_SIZE  # type: ignore
+        )
+        self._queue: queue.Queue[Optional[bytes]] = queue.Queue(
+            maxsize=BATCH_WRITE_QUEUE_SIZE
+        )
+        self._pending: list[bytes] = []
+        self._error: Optional[Exception] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        # Keep draining until the sentinel even after an error so that
+        # the producer never blocks on a full queue
+        data = self._queue.get()
+        while data is not None:
+            if self._error is None:
+                try:
+                    self._out.write(data)
+                except Exception as e:
+                    self._error = e
+            data = self._queue.get()
+
+        try:
+            # Flushes the buffer and closes the gzip stream
+            self._out.close()
+        except Exception as e:
+            self._error = self._error or e
+
+    def write(self, data: bytes) -> None:
+        """Queue data to be compressed and written."""
+        pending = self._pending
+        pending.append(data)
+        if len(pending) >= BATCH_WRITE_CHUNK_RECORDS:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        if self._error is not None:
+            raise self._error
+        # One queue handoff per chunk instead of one per record
+        self._queue.put(b"".join(self._pending))
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Write everything queued and close the gzip stream.
+
+        Safe to call again, e.g. to clean up after a failed write or close.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        try:
+            if self._pending and self._error is None:
+                self._flush_pending()
+        finally:
+            # Always stop the thread, even if the pending records were lost
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+class _RateLimiter:
+    """Spaces out calls to `wait` across threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self, interval: float) -> None:
+        """Block until at least `interval` seconds have passed since the last call."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+_RATE_LIMITER = _RateLimiter()
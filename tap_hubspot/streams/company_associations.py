@@ -11,21 +11,24 @@ class CompanyAssociationsStream(HubSpotStream):
     properties_object_type = "companies"
     primary_keys = ["id"]
     replication_key = None
-    schema = th.PropertiesList(
-        th.Property(
-            "id",
-            th.StringType,
-        ),
-        th.Property(
-            "updatedAt",
-            th.DateTimeType,
-        ),
-        th.Property(
-            "archived",
-            th.BooleanType,
-        ),
-        th.Property(
-            "associations",
-            th.StringType,
-        ),
-    ).to_dict()
+
+    @property
+    def schema(self):
+        return th.PropertiesList(
+            th.Property(
+                "id",
+                th.StringType,
+            ),
+            th.Property(
+                "updatedAt",
+                th.DateTimeType,
+            ),
+            th.Property(
+                "archived",
+                th.BooleanType,
+            ),
+            th.Property(
+                "associations",
+                self.nested_json_type,
+            ),
+        ).to_dict()
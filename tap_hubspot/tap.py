@@ -1,6 +1,8 @@
 """HubSpot tap class."""
 
-from typing import List
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, cast
 
 from singer_sdk import Stream, Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
@@ -11,6 +13,7 @@ from singer_sdk.helpers.capabilities import (
     TapCapabilities,
 )
 
+from tap_hubspot.client import HubSpotStream
 from tap_hubspot.streams.calls import CallsStream
 from tap_hubspot.streams.companies import CompaniesStream
 from tap_hubspot.streams.company_associations import CompanyAssociationsStream
@@ -75,6 +78,16 @@ class TapHubSpot(Tap):
                 " - implies full table replication"
             ),
         ),
+        th.Property(
+            "nested_as_objects",
+            th.BooleanType,
+            required=False,
+            default=False,
+            description=(
+                "Set to True to output properties and associations as JSON objects"
+                " instead of JSON encoded strings"
+            ),
+        ),
         th.Property(
             "batch_size",
             th.IntegerType,
@@ -82,6 +95,42 @@ class TapHubSpot(Tap):
             default=1_000_000,
             description="Size of batch files",
         ),
+        th.Property(
+            "include_properties",
+            th.ObjectType(additional_properties=th.ArrayType(th.StringType)),
+            required=False,
+            description=(
+                "Only fetch these properties, as a list per stream name."
+                " Streams not listed fetch all properties"
+            ),
+        ),
+        th.Property(
+            "properties_cache",
+            th.BooleanType,
+            required=False,
+            default=False,
+            description="Set to True to cache the list of properties between runs",
+        ),
+        th.Property(
+            "properties_ttl",
+            th.IntegerType,
+            required=False,
+            default=3600,
+            description="Seconds before cached properties are fetched again",
+        ),
+        th.Property(
+            "stream_concurrency",
+            th.IntegerType,
+            required=False,
+            default=1,
+            description="Number of streams to sync at the same time",
+        ),
+        th.Property(
+            "max_requests_per_second",
+            th.NumberType,
+            required=False,
+            description="Limits the rate of requests to HubSpot over all streams",
+        ),
         th.Property(
             "batch_config",
             th.ObjectType(
@@ -112,6 +161,50 @@ class TapHubSpot(Tap):
         """Return a list of discovered streams."""
         return [stream_class(tap=self) for stream_class in STREAM_TYPES]
 
+    # The SDK marks this final but offers no other hook to run streams in parallel
+    def sync_all(self) -> None:  # type: ignore[misc]
+        """Sync all streams, running `stream_concurrency` of them at a time."""
+        stream_concurrency = self.config.get("stream_concurrency", 1)
+        if stream_concurrency <= 1:
+            super().sync_all()
+            return
+
+        self._reset_state_progress_markers()
+        self._set_compatible_replication_methods()
+
+        streams: List[HubSpotStream] = []
+        for stream in self.streams.values():
+            if not stream.selected and not stream.has_selected_descendents:
+                self.logger.info(f"Skipping deselected stream '{stream.name}'.")
+            elif not stream.parent_stream_type:
+                # Create the stream's bookmark up front, so the threads only
+                # ever update existing entries of the shared state
+                stream.get_context_state(None)
+                streams.append(cast(HubSpotStream, stream))
+
+        # Each thread changes its own stream's bookmark without a lock, so STATE
+        # messages are written from a copy only updated under STATE_LOCK
+        state_snapshot = copy.deepcopy(self.state)
+        for stream in streams:
+            stream._state_snapshot = state_snapshot
+        try:
+            with ThreadPoolExecutor(max_workers=stream_concurrency) as executor:
+                futures = [executor.submit(self._sync_stream, s) for s in streams]
+                for future in futures:
+                    # Raises any exception from the stream's sync
+                    future.result()
+        finally:
+            for stream in streams:
+                stream._state_snapshot = None
+
+        for stream in self.streams.values():
+            stream.log_sync_costs()
+
+    @staticmethod
+    def _sync_stream(stream: Stream) -> None:
+        stream.sync()
+        stream.finalize_state_progress_markers()
+
     @classproperty
     def capabilities(self) -> List[CapabilitiesEnum]:
         """Get tap capabilities.
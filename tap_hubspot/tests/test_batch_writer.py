@@ -0,0 +1,77 @@
+"""Tests compressing batch files without calling HubSpot."""
+
+import gzip
+import io
+import threading
+
+import pytest
+from singer_sdk.helpers._batch import BatchConfig
+
+from tap_hubspot.client import BATCH_WRITE_CHUNK_RECORDS, _BackgroundGzipWriter
+from tap_hubspot.tap import TapHubSpot
+
+
+class _FailingFile(io.BytesIO):
+    fail = False
+
+    def write(self, data):
+        if self.fail:
+            raise OSError("disk full")
+        return super().write(data)
+
+
+def _records(count):
+    return [f'{{"id":"{i}"}}\n'.encode() for i in range(count)]
+
+
+@pytest.mark.parametrize(
+    "count", [1, BATCH_WRITE_CHUNK_RECORDS, 2 * BATCH_WRITE_CHUNK_RECORDS + 1]
+)
+def test_round_trip(count):
+    """Tests full chunks and the pending tail are all written on close"""
+    records = _records(count)
+    f = io.BytesIO()
+    out = _BackgroundGzipWriter(f)
+    for record in records:
+        out.write(record)
+    out.close()
+
+    assert gzip.decompress(f.getvalue()) == b"".join(records)
+
+
+def test_writer_thread_error():
+    """Tests errors writing the file are raised by close"""
+    f = _FailingFile()
+    out = _BackgroundGzipWriter(f)
+    f.fail = True
+    for record in _records(BATCH_WRITE_CHUNK_RECORDS + 1):
+        out.write(record)
+
+    with pytest.raises(OSError, match="disk full"):
+        out.close()
+    assert not out._thread.is_alive()
+    # Cleaning up again doesn't block or raise
+    out.close()
+
+
+def test_failed_sync_stops_writer(tmp_path):
+    """Tests the compressor thread stops when the sync fails mid batch"""
+    tap = TapHubSpot(config={"hapikey": "not-used"}, parse_env_config=False)
+    stream = tap.streams["owners"]
+
+    def failing_sync_records(context, write_messages=False):
+        yield {"id": "1"}
+        raise RuntimeError("HubSpot is down")
+
+    stream._sync_records = failing_sync_records
+    batch_config = BatchConfig.from_dict(
+        {
+            "encoding": {"format": "jsonl", "compression": "gzip"},
+            "storage": {"root": tmp_path.as_uri()},
+        }
+    )
+    threads = threading.active_count()
+
+    with pytest.raises(RuntimeError, match="HubSpot is down"):
+        list(stream.get_batches(batch_config))
+    assert threading.active_count() == threads
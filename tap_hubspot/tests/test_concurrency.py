@@ -0,0 +1,65 @@
+"""Tests syncing several streams at once without calling HubSpot."""
+
+import json
+from typing import Iterable, List, Optional
+
+from singer_sdk import Stream
+from singer_sdk import typing as th
+
+from tap_hubspot.client import HubSpotStream
+from tap_hubspot.tap import TapHubSpot
+
+SAMPLE_CONFIG = {
+    "hapikey": "not-used",
+    "start_from": "2022-04-13T07:41:30.007Z",
+    "stream_concurrency": 2,
+}
+
+
+class _FakeStream(HubSpotStream):
+    primary_keys = ["id"]
+    replication_key = "updatedAt"
+    schema = th.PropertiesList(
+        th.Property("id", th.StringType),
+        th.Property("updatedAt", th.DateTimeType),
+    ).to_dict()
+
+    def get_records(self, context: Optional[dict]) -> Iterable[dict]:
+        for day in range(1, 4):
+            yield {"id": str(day), "updatedAt": f"2023-01-0{day}T00:00:00+00:00"}
+
+
+class _FirstStream(_FakeStream):
+    name = "first"
+
+
+class _SecondStream(_FakeStream):
+    name = "second"
+
+
+class _FakeTap(TapHubSpot):
+    def discover_streams(self) -> List[Stream]:
+        return [_FirstStream(tap=self), _SecondStream(tap=self)]
+
+
+def test_sync_concurrently(capsys):
+    """Tests all streams sync and finalize their bookmarks"""
+    tap = _FakeTap(config=SAMPLE_CONFIG, parse_env_config=False)
+    tap.sync_all()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    records = [m["stream"] for m in messages if m["type"] == "RECORD"]
+    assert records.count("first") == 3
+    assert records.count("second") == 3
+
+    for name in ("first", "second"):
+        bookmark = tap.state["bookmarks"][name]
+        assert bookmark["replication_key"] == "updatedAt"
+        assert bookmark["replication_key_value"] == "2023-01-03T00:00:00+00:00"
+        assert "progress_markers" not in bookmark
+        assert "starting_replication_value" not in bookmark
+        assert tap.streams[name]._state_snapshot is None
+
+    # The last STATE message has both streams' bookmarks
+    last_state = [m for m in messages if m["type"] == "STATE"][-1]
+    assert set(last_state["value"]["bookmarks"]) == {"first", "second"}
@@ -0,0 +1,57 @@
+"""Tests paging past the 10K search results limit without calling HubSpot."""
+
+import json
+
+import pytest
+import requests
+
+from tap_hubspot.tap import TapHubSpot
+
+SAMPLE_CONFIG = {
+    "hapikey": "not-used",
+    "start_from": "2022-04-13T07:41:30.007Z",
+}
+
+
+def _search_response(last_modified: str, after: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(
+        {
+            "results": [
+                {"id": "1", "properties": {"hs_lastmodifieddate": last_modified}}
+            ],
+            "paging": {"next": {"after": after}},
+        }
+    ).encode()
+    return response
+
+
+def _sync_page(stream, paginator, response):
+    for row in stream.parse_response(response):
+        stream.post_process(row)
+    paginator.advance(response)
+
+
+def test_resumes_from_last_record():
+    """Tests the search restarts at the last record seen near the limit"""
+    tap = TapHubSpot(config=SAMPLE_CONFIG, parse_env_config=False)
+    stream = tap.streams["companies"]
+    stream.extra_properties = ["name"]
+    paginator = stream.get_new_paginator()
+
+    _sync_page(stream, paginator, _search_response("2023-01-01T00:00:00.000Z", "9900"))
+    assert paginator.current_value is None
+    assert not paginator.finished
+
+    payload = stream.prepare_request_payload(None, paginator.current_value)
+    assert "after" not in payload
+    (gte_filter,) = payload["filterGroups"][0]["filters"]
+    assert gte_filter["operator"] == "GTE"
+    assert gte_filter["value"] == 1672531200000
+
+    # 10K more records with the same value can't be paged past
+    with pytest.raises(RuntimeError):
+        _sync_page(
+            stream, paginator, _search_response("2023-01-01T00:00:00.000Z", "9900")
+        )
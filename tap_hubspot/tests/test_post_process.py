@@ -0,0 +1,42 @@
+"""Tests transforming records without calling HubSpot."""
+
+import json
+from typing import Optional
+
+from tap_hubspot.streams.companies import CompaniesStream
+from tap_hubspot.tap import TapHubSpot
+
+SAMPLE_CONFIG = {"hapikey": "not-used"}
+
+
+def _row(i):
+    return {"id": str(i), "properties": {"hs_lastmodifieddate": "2023-01-01T00:00:00Z"}}
+
+
+def test_post_process():
+    """Tests the replication key is copied and properties are stringified"""
+    tap = TapHubSpot(config=SAMPLE_CONFIG, parse_env_config=False)
+    stream = tap.streams["companies"]
+
+    for i in range(3):
+        row = stream.post_process(_row(i))
+        assert row["hs_lastmodifieddate"].isoformat() == "2023-01-01T00:00:00+00:00"
+        assert json.loads(row["properties"]) == _row(i)["properties"]
+
+
+def test_post_process_override():
+    """Tests a subclass overriding post_process runs for every record"""
+
+    class _CompaniesStream(CompaniesStream):
+        def post_process(self, row: dict, context: Optional[dict] = None) -> dict:
+            row = super().post_process(row, context)
+            row["overridden"] = True
+            return row
+
+    tap = TapHubSpot(config=SAMPLE_CONFIG, parse_env_config=False)
+    stream = _CompaniesStream(tap=tap)
+
+    for i in range(3):
+        row = stream.post_process(_row(i))
+        assert row["overridden"]
+        assert isinstance(row["properties"], str)
@@ -0,0 +1,57 @@
+"""Tests choosing the properties to fetch without calling HubSpot."""
+
+import pytest
+
+from tap_hubspot.tap import TapHubSpot
+
+HUBSPOT_PROPERTIES = ["name", "domain", "hs_lastmodifieddate"]
+
+
+def _stream(name, include_properties, **config):
+    tap = TapHubSpot(
+        config={
+            "hapikey": "not-used",
+            "include_properties": include_properties,
+            **config,
+        },
+        parse_env_config=False,
+    )
+    stream = tap.streams[name]
+    stream._fetch_properties = lambda: list(HUBSPOT_PROPERTIES)
+    return stream
+
+
+def test_all_properties():
+    """Tests all properties are fetched without an allowlist"""
+    stream = _stream("companies", {})
+    assert stream.get_properties() == HUBSPOT_PROPERTIES
+
+
+def test_include_properties(monkeypatch):
+    """Tests unknown properties are warned about and the replication key is kept"""
+    stream = _stream("companies", {"companies": ["name", "bogus"]})
+    warnings = []
+    monkeypatch.setattr(stream.logger, "warning", warnings.append)
+    assert stream.get_properties() == ["name", "hs_lastmodifieddate"]
+    assert warnings == ["Ignoring unknown companies properties: bogus"]
+
+
+def test_include_properties_without_search():
+    """Tests only the included properties are fetched without a replication key"""
+    stream = _stream("companies", {"companies": ["name"]}, no_search=True)
+    assert stream.get_properties() == ["name"]
+
+
+@pytest.mark.parametrize(
+    "include_properties,config",
+    [
+        (["bogus"], {}),
+        ([], {}),
+        ([], {"no_search": True}),
+    ],
+)
+def test_no_properties_to_include(include_properties, config):
+    """Tests an allowlist leaving no properties to send fails"""
+    stream = _stream("companies", {"companies": include_properties}, **config)
+    with pytest.raises(RuntimeError):
+        stream.get_properties()
@@ -0,0 +1,78 @@
+"""Tests caching HubSpot's property lists on disk without calling HubSpot."""
+
+import json
+import os
+import time
+
+import pytest
+import requests
+
+from tap_hubspot import client
+from tap_hubspot.tap import TapHubSpot
+
+
+@pytest.fixture
+def requests_sent(monkeypatch, tmp_path):
+    """Points the cache at tmp_path and counts the properties requests"""
+    monkeypatch.setattr(client, "SCHEMAS_DIR", tmp_path)
+    sent = []
+
+    def send(request, **kwargs):
+        sent.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"results": [{"name": "name"}]}).encode()
+        return response
+
+    monkeypatch.setattr(client._SESSION, "send", send)
+    return sent
+
+
+def _stream(hapikey="not-used"):
+    tap = TapHubSpot(
+        config={"hapikey": hapikey, "properties_cache": True, "properties_ttl": 60},
+        parse_env_config=False,
+    )
+    return tap.streams["companies"]
+
+
+def test_cache_hit(requests_sent):
+    """Tests properties are read from the cache within the TTL"""
+    assert _stream()._fetch_properties() == ["name"]
+    assert _stream()._fetch_properties() == ["name"]
+    assert len(requests_sent) == 1
+
+
+def test_cache_expired(requests_sent):
+    """Tests properties are fetched again after the TTL"""
+    stream = _stream()
+    stream._fetch_properties()
+    expired = time.time() - 120
+    os.utime(stream._properties_cache_path, (expired, expired))
+
+    assert _stream()._fetch_properties() == ["name"]
+    assert len(requests_sent) == 2
+
+
+def test_cache_corrupt(requests_sent):
+    """Tests a corrupt cache file is replaced by fetching the properties"""
+    stream = _stream()
+    stream._properties_cache_path.parent.mkdir(parents=True)
+    stream._properties_cache_path.write_text("[not json")
+
+    assert stream._fetch_properties() == ["name"]
+    assert len(requests_sent) == 1
+    assert json.loads(stream._properties_cache_path.read_text()) == ["name"]
+
+
+def test_cache_per_token(requests_sent, tmp_path):
+    """Tests each HubSpot account gets its own cache file"""
+    first, second = _stream("first-token"), _stream("second-token")
+    assert first._properties_cache_path != second._properties_cache_path
+    assert first._properties_cache_path.name.startswith("companies-")
+    assert "first-token" not in str(first._properties_cache_path)
+
+    first._fetch_properties()
+    second._fetch_properties()
+    assert len(requests_sent) == 2
+    assert len(list((tmp_path / ".properties_cache").iterdir())) == 2